@@ -1,20 +1,52 @@
 import logging
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 import requests
+from six.moves import intern
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 
-from .exceptions import KazooApiAuthenticationError
+try:
+    from inspect import Parameter, Signature
+except ImportError:
+    from funcsigs import Parameter, Signature
+
+from .exceptions import KazooApiAuthenticationError, InvalidHttpMethodError
+from .http2 import Http2Session
 from .request_objects import (
-    KazooRequest, UsernamePasswordAuthRequest, ApiKeyAuthRequest)
+    KazooRequest, UsernamePasswordAuthRequest, ApiKeyAuthRequest,
+    dumps, parse_json_response)
 from .rest_resources import RestResource
 
 
 logger = logging.getLogger(__name__)
 
+RATEDECK_BUFFER_SIZE = 1024 * 1024
+
+RETRY_METHODS = frozenset(["GET", "DELETE", "HEAD", "OPTIONS"])
+
 
 def parse_list(blob):
-    return blob[1:-1].split(',')
+    if blob.startswith('[') and blob.endswith(']'):
+        blob = blob[1:-1]
+    return blob.split(',')
+
+
+class LazyResourceMethod(object):
+    """Descriptor standing in for a generated resource method until it is
+    first accessed, at which point the method is generated and replaces the
+    descriptor on the class.
+    """
+    def __init__(self, owner, args, kwargs):
+        self.owner = owner
+        self.args = args
+        self.kwargs = kwargs
+
+    def __get__(self, instance, owner):
+        func = self.owner._generate_resource_func(*self.args, **self.kwargs)
+        setattr(self.owner, func.__name__, func)
+        return func.__get__(instance, owner)
 
 
 class RestClientMetaClass(type):
@@ -25,25 +57,26 @@ class RestClientMetaClass(type):
                 cls._add_resource_methods(key, value, dct)
 
     def _add_resource_methods(cls, resource_field_name, rest_resource, dct):
+        resource_field_name = intern(resource_field_name)
         cls._generate_list_func(resource_field_name, rest_resource)
         cls._generate_get_object_func(resource_field_name, rest_resource)
         cls._generate_delete_object_func(resource_field_name, rest_resource)
         cls._generate_update_object_func(resource_field_name, rest_resource)
         cls._generate_create_object_func(resource_field_name, rest_resource)
-        for view_desc in rest_resource.extra_views:
-            cls._generate_extra_view_func(view_desc, resource_field_name,
-                                          rest_resource)
+        for view_index, view_desc in enumerate(rest_resource.extra_views):
+            cls._generate_extra_view_func(view_index, view_desc,
+                                          resource_field_name, rest_resource)
 
     def _generate_create_object_func(cls, resource_field_name, rest_resource):
         if "create" not in rest_resource.methods:
             return
         func_name = rest_resource.method_names["create"]
         required_args = rest_resource.required_args
-        func = cls._generate_resource_func(
+        func = cls._lazy_resource_func(
             func_name,
             resource_field_name,
             required_args,
-            request_type='get_create_object_request',
+            request_type='get_create_object_request_pos',
             requires_data=True)
         setattr(cls, func_name, func)
 
@@ -52,11 +85,11 @@ class RestClientMetaClass(type):
             return
         func_name = rest_resource.method_names["list"]
         required_args = rest_resource.required_args
-        func = cls._generate_resource_func(
+        func = cls._lazy_resource_func(
             func_name,
             resource_field_name,
             required_args,
-            request_type='get_list_request')
+            request_type='get_list_request_pos')
         setattr(cls, func_name, func)
 
     def _generate_get_object_func(cls, resource_field_name, rest_resource):
@@ -65,11 +98,11 @@ class RestClientMetaClass(type):
         func_name = rest_resource.method_names["object"]
         required_args = (rest_resource.required_args +
                          [rest_resource.object_arg])
-        func = cls._generate_resource_func(
+        func = cls._lazy_resource_func(
             func_name,
             resource_field_name,
             required_args,
-            request_type='get_object_request')
+            request_type='get_object_request_pos')
         setattr(cls, func_name, func)
 
     def _generate_delete_object_func(cls, resource_field_name, rest_resource):
@@ -78,11 +111,11 @@ class RestClientMetaClass(type):
         func_name = rest_resource.method_names["delete"]
         required_args = (rest_resource.required_args +
                          [rest_resource.object_arg])
-        func = cls._generate_resource_func(
+        func = cls._lazy_resource_func(
             func_name,
             resource_field_name,
             required_args,
-            request_type='get_delete_object_request')
+            request_type='get_delete_object_request_pos')
         setattr(cls, func_name, func)
 
     def _generate_update_object_func(cls, resource_field_name, rest_resource):
@@ -91,16 +124,16 @@ class RestClientMetaClass(type):
         func_name = rest_resource.method_names["update"]
         required_args = (rest_resource.required_args +
                          [rest_resource.object_arg])
-        func = cls._generate_resource_func(
+        func = cls._lazy_resource_func(
             func_name,
             resource_field_name,
             required_args,
-            request_type='get_update_object_request',
+            request_type='get_update_object_request_pos',
             requires_data=True)
         setattr(cls, func_name, func)
 
-    def _generate_extra_view_func(cls, extra_view_desc, resource_field_name,
-                                  rest_resource):
+    def _generate_extra_view_func(cls, extra_view_index, extra_view_desc,
+                                  resource_field_name, rest_resource):
         func_name = extra_view_desc["name"]
         if extra_view_desc["scope"] == "aggregate":
             required_args = rest_resource.required_args
@@ -111,55 +144,59 @@ class RestClientMetaClass(type):
             requires_data = True
         else:
             requires_data = False
-        func = cls._generate_resource_func(
+        func = cls._lazy_resource_func(
             func_name,
             resource_field_name,
             required_args,
-            extra_view_name=extra_view_desc["path"],
+            extra_view_index=extra_view_index,
             requires_data=requires_data)
         setattr(cls, func_name, func)
 
-    @staticmethod
-    def _generate_resource_func(func_name, resource_field_name,
+    def _lazy_resource_func(cls, *args, **kwargs):
+        # Building the function is deferred until the method is first
+        # accessed, so resource methods which are never used cost nothing.
+        return LazyResourceMethod(cls, args, kwargs)
+
+    def _generate_resource_func(cls, func_name, resource_field_name,
                                 resource_required_args, request_type=None,
-                                extra_view_name=None, requires_data=False):
-        # import pdb; pdb.set_trace()
-        # This is quite nasty, the point of it is to generate a function which
-        # has named required arguments so that it is nicely self documenting.
-        # If yo're having trouble following it stick a print statement in
-        # around the func_definition variable and then import in a shell.
+                                extra_view_index=None, requires_data=False):
+        # The generated function carries a signature naming the required
+        # arguments so that it is nicely self documenting. It passes its
+        # arguments positionally to the resource to build the request, calls
+        # using keyword arguments are first bound against the signature to
+        # put them in order.
+        func_name = intern(func_name)
+        resource_field_name = intern(resource_field_name)
         required_args = list(resource_required_args)
         if requires_data:
             required_args.append("data")
-        required_args_str = ",".join(required_args)
-        if required_args:
-            required_args_str += ","
-        get_request_args = ",".join(["{0}={0}".format(argname)
-                                     for argname in required_args])
-        if request_type:
-            get_request_string = "self.{0}.{1}({2})".format(
-                resource_field_name, request_type, get_request_args)
-        else:
-            get_req_templ = "self.{0}.get_extra_view_request(\"{1}\",{2})"
-            get_request_string = get_req_templ.format(
-                resource_field_name, extra_view_name, get_request_args)
-        if requires_data:
-            func_definition = (
-                "def {0}(self, {1}): "
-                "return self._execute_request({2}, data=data)".format(
-                    func_name, required_args_str, get_request_string
-                ))
-        else:
-            func_definition = (
-                "def {0}(self, {1}): "
-                "return self._execute_request({2})".format(
-                    func_name, required_args_str, get_request_string
-                ))
-
-        func = compile(func_definition, __file__, 'exec')
-        d = {}
-        exec(func, d)
-        return d[func_name]
+        num_args = len(required_args)
+        signature = Signature([
+            Parameter(argname, Parameter.POSITIONAL_OR_KEYWORD)
+            for argname in ["self"] + required_args])
+
+        def func(self, *args, **kwargs):
+            if kwargs or len(args) != num_args:
+                args = tuple(
+                    signature.bind(self, *args, **kwargs).arguments.values()
+                )[1:]
+            if requires_data:
+                data = args[-1]
+                args = args[:-1]
+            resource = getattr(self, resource_field_name)
+            if request_type:
+                request = getattr(resource, request_type)(*args)
+            else:
+                request = resource.get_extra_view_request_fast(
+                    extra_view_index, *args)
+            if requires_data:
+                return self._execute_request(request, data=data)
+            return self._execute_request(request)
+
+        func.__signature__ = signature
+        func.__name__ = func_name
+        func.__qualname__ = "{0}.{1}".format(cls.__name__, func_name)
+        return func
 
 
 class Client(six.with_metaclass(RestClientMetaClass)):
@@ -180,6 +217,18 @@ class Client(six.with_metaclass(RestClientMetaClass)):
                                  account_name="my_account_name")
         >>>client.authenticate()
 
+    If `httpx <https://www.python-httpx.org>`_ is installed you can pass
+    'use_http2=True' to send requests over HTTP/2, multiplexing concurrent
+    requests such as those made by :meth:`activate_apps()` over a single
+    connection: ::
+
+        >>>client = kazoo.Client(api_key="sdfasdfas", use_http2=True)
+
+    The HTTP/2 session keeps its own connection limits and ignores
+    'pool_connections' and 'pool_maxsize'. It also only retries connection
+    errors, unlike the default session 502, 503 and 504 responses are not
+    retried.
+
     The default api url is: 'http://api.2600hz.com:8000/v1'.  You can override
     this by supplying an extra argument, 'base_url' to kazoo.Client().
 
@@ -188,6 +237,15 @@ class Client(six.with_metaclass(RestClientMetaClass)):
         >>>client = kazoo.Client(base_url='http://api.example.com:8000/v1',
                                  api_key="sdfasdfas")
 
+    All requests made by a client share a single session, a
+    :class:`requests.Session` unless HTTP/2 is used, so connections to the
+    API host are pooled and reused. Call
+    :meth:`close()` when you are done with the client, or use it as a
+    context manager: ::
+
+        >>>with kazoo.Client(api_key="sdfasdfas") as client:
+        ...    client.authenticate()
+
     API calls which require data take it in the form of a required argument
     called 'data' which is the last argument to the method. For example ::
 
@@ -257,6 +315,9 @@ class Client(six.with_metaclass(RestClientMetaClass)):
     """
     base_url = "http://api.2600hz.com:8000/v1"
 
+    pool_connections = 10
+    pool_maxsize = 50
+
     _accounts_resource = RestResource("account",
                                       "/accounts/{account_id}",
                                       exclude_methods=[],
@@ -394,7 +455,7 @@ class Client(six.with_metaclass(RestClientMetaClass)):
         "/accounts/{account_id}/webhooks/{webhook_id}")
 
     def __init__(self, api_key=None, password=None, account_name=None,
-                 username=None, base_url=None):
+                 username=None, base_url=None, use_http2=False):
         if not api_key and not password:
             raise RuntimeError("You must pass either an api_key or an "
                                "account name/password pair")
@@ -417,18 +478,91 @@ class Client(six.with_metaclass(RestClientMetaClass)):
         self.api_key = api_key
         self._authenticated = False
         self.auth_token = None
+        self.use_http2 = use_http2
+        self.session = self._create_session()
+        self._method_dispatch = self._create_method_dispatch(self.session)
+
+    def _create_session(self):
+        """Create the :class:`requests.Session` shared by every API call so
+        that connections to the kazoo host are pooled and kept alive, or an
+        :class:`~kazoo.http2.Http2Session` if HTTP/2 was requested.
+        """
+        if self.use_http2:
+            return Http2Session()
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self._create_retry())
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @staticmethod
+    def _create_retry():
+        # Only idempotent methods are retried, PUT creates objects in kazoo
+        # so replaying it could create duplicates. Once retries run out the
+        # last response is returned rather than raising, so error responses
+        # are still handled by the caller. raise_on_status needs urllib3
+        # 1.15, which requests bundles from 2.10.
+        kwargs = dict(total=3, backoff_factor=0.1,
+                      status_forcelist=[502, 503, 504],
+                      raise_on_status=False)
+        try:
+            return Retry(allowed_methods=RETRY_METHODS, **kwargs)
+        except TypeError:
+            # urllib3 < 1.26 calls allowed_methods method_whitelist
+            return Retry(method_whitelist=RETRY_METHODS, **kwargs)
+
+    @staticmethod
+    def _create_method_dispatch(session):
+        # Keyed by both lower and upper case method names so the common
+        # spellings avoid a str.lower() per request.
+        dispatch = {}
+        for method in KazooRequest.http_methods + ("patch",):
+            dispatch[method] = dispatch[method.upper()] = getattr(session,
+                                                                  method)
+        return dispatch
+
+    def close(self):
+        """Close the underlying HTTP session and release pooled connections
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def authenticate(self):
         """Call this before making other api calls to fetch an auth token
         which will be automatically used for all further requests
         """
         if not self._authenticated:
-            self.auth_data = self.auth_request.execute(self.base_url)
+            self.auth_data = self.auth_request.execute(self.base_url,
+                                                       session=self.session)
             self.auth_token = self.auth_data["auth_token"]
             self._authenticated = True
         return self.auth_token
 
+    @property
+    def auth_token(self):
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, auth_token):
+        self._auth_token = auth_token
+        self._update_base_headers()
+
+    def _update_base_headers(self):
+        # Rebuilt whenever the auth token changes so manual_request doesn't
+        # have to construct the default headers on every call.
+        self._base_headers = {'Content-Type': 'application/json',
+                              'X-Auth-Token': self.auth_token}
+
     def _execute_request(self, request, **kwargs):
+        kwargs["session"] = self.session
         if request.auth_required:
             kwargs["token"] = self.auth_token
 
@@ -492,7 +626,7 @@ class Client(six.with_metaclass(RestClientMetaClass)):
 
     def upload_ratedeck(self, path):
         headers = {'Content-Type': 'text/csv'}
-        with open(path, 'rb') as fd:
+        with open(path, 'rb', RATEDECK_BUFFER_SIZE) as fd:
             return self.manual_request('/rates', 'post', headers, fd)
 
     def add_service_plans_to_account(self, acct_id, service_plan_ids):
@@ -502,21 +636,32 @@ class Client(six.with_metaclass(RestClientMetaClass)):
 
     def manual_request(self, uri, method='get', headers=None,
                        data=None, files=None):
+        """Make a request to an arbitrary uri of the kazoo api
+
+        Dictionaries passed as data are serialized to json, file objects are
+        streamed to the server from disk rather than read into memory.
+        """
         url = self.base_url + uri
 
-        headers_ = {'Content-Type': 'application/json',
-                    'X-Auth-Token': self.auth_token}
-        headers_.update(headers or {})
-        headers = headers_
+        if headers:
+            headers_ = dict(self._base_headers)
+            headers_.update(headers)
+            headers = headers_
+        else:
+            headers = self._base_headers
 
         if isinstance(data, dict):
-            data = json.dumps(data)
-
-        method = getattr(requests, method.lower())
-        r = method(
-            url, headers=headers, data=data, files=files)
-        if r.ok:
-            return True, r.json()['data']
+            data = dumps(data)
+
+        request_func = self._method_dispatch.get(method)
+        if request_func is None:
+            request_func = self._method_dispatch.get(method.lower())
+            if request_func is None:
+                raise InvalidHttpMethodError(
+                    "method {0} is not a valid http method".format(method))
+        r = request_func(url, headers=headers, data=data, files=files)
+        if r.status_code < 400:
+            return True, parse_json_response(r)['data']
         else:
             return False, r
 
@@ -532,9 +677,17 @@ class Client(six.with_metaclass(RestClientMetaClass)):
         return self.manual_request(uri, method='put', data=data)
 
     def activate_apps(self, acct_id, **kwargs):
+        """Activate every app in the account's app store.
+
+        The activation requests are issued concurrently from a thread pool
+        sharing the client's session. Pass ``max_workers`` (default 8) to
+        tune concurrency to the rate limit of the kazoo server.
+        """
         _, apps = self.list_apps(acct_id)
-        return [
-            self.activate_app(acct_id, app['id']) for app in apps]
+        max_workers = kwargs.get('max_workers', 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda app: self.activate_app(acct_id, app['id']), apps))
 
     def sup(self, module, function, *args):
         if module.endswith('_maintenance'):
@@ -0,0 +1,67 @@
+from .exceptions import InvalidConfigurationError
+
+
+class Http2Session(object):
+    """An HTTP/2 session backed by :class:`httpx.Client`
+
+    It exposes the subset of the :class:`requests.Session` interface used by
+    the kazoo client, so it can be used in its place. Requests made through
+    it are multiplexed over a single connection to the API host.
+
+    Only connection errors are retried, http error responses such as 502,
+    503 and 504 are returned to the caller as they are.
+    """
+    def __init__(self, timeout=30, max_connections=20,
+                 max_keepalive_connections=10, retries=3):
+        # httpx is imported here rather than at module level so that
+        # importing kazoo doesn't pay for it unless HTTP/2 is used.
+        # The HTTP/2 transport needs h2 as well, which httpx only imports
+        # once a connection is made, so check for it up front.
+        try:
+            import httpx
+            import h2  # noqa
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections)
+            transport = httpx.HTTPTransport(http2=True, limits=limits,
+                                            retries=retries)
+        except ImportError:
+            raise InvalidConfigurationError(
+                "HTTP/2 support requires httpx and h2, install them with "
+                "pip install kazoo-sdk[http2]")
+        self.client = httpx.Client(transport=transport, timeout=timeout)
+
+    def request(self, method, url, headers=None, data=None, files=None):
+        kwargs = {}
+        if headers:
+            # requests leaves out headers set to None, httpx rejects them
+            kwargs["headers"] = dict(
+                (name, value) for name, value in headers.items()
+                if value is not None)
+        # httpx only accepts form fields as data, raw bodies such as
+        # serialized json or file objects are passed as content.
+        if isinstance(data, dict):
+            kwargs["data"] = data
+        elif data is not None:
+            kwargs["content"] = data
+        if files:
+            kwargs["files"] = files
+        return self.client.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def close(self):
+        self.client.close()
@@ -2,10 +2,17 @@ import json
 import hashlib
 import logging
 import re
+import sys
+from collections import OrderedDict
 
 import requests
 from six.moves.urllib.parse import urlencode
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .exceptions import (
     KazooApiError,
     KazooApiAuthenticationError,
@@ -16,8 +23,39 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+PARAM_RE = re.compile(r"\{([a-zA-Z0-9_]+)\}")
+
+# Use orjson when it is installed, it is considerably faster than the json
+# module and encodes straight to bytes which requests can send as is.
+#
+# Responses are decoded preserving the order of keys in json objects, some
+# kazoo configs rely on this behavior! orjson and plain dicts from python 3.7
+# onwards already do so, the slower OrderedDict hook is only needed before it.
+if orjson is not None:
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    loads = orjson.loads
+else:
+    if sys.version_info < (3, 7):
+        _LOADS_KWARGS = {"object_pairs_hook": OrderedDict}
+    else:
+        _LOADS_KWARGS = {}
+
+    def dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(content):
+        return json.loads(content, **_LOADS_KWARGS)
+
+
+def parse_json_response(raw_response):
+    return loads(raw_response.content)
+
 
 class KazooRequest(object):
+    __slots__ = ("path", "_required_param_names", "auth_required", "method",
+                 "get_params")
     http_methods = ("get", "post", "put", "delete")
 
     def __init__(self, path, auth_required=True, method='get',
@@ -34,9 +72,11 @@ class KazooRequest(object):
 
     @staticmethod
     def _get_params_from_path(path):
-        param_regex = re.compile("{([a-zA-Z0-9_]+)}")
-        param_names = param_regex.findall(path)
-        return param_names
+        # Paths built by rest resources are already formatted, skip the regex
+        # engine entirely when there is nothing to find.
+        if "{" not in path:
+            return []
+        return PARAM_RE.findall(path)
 
     def _get_headers(self, token=None):
         headers = {"Content-Type": "application/json"}
@@ -54,7 +94,7 @@ class KazooRequest(object):
         return self.path.format(**params)
 
     def execute(self, base_url, method=None, data=None, token=None,
-                files=None, **kwargs):
+                files=None, session=None, **kwargs):
         if method is None:
             method = self.method
         if method.lower() not in self.http_methods:
@@ -69,17 +109,17 @@ class KazooRequest(object):
                      method, full_url.encode("utf-8"))
 
         headers = self._get_headers(token=token)
-        req_func = getattr(requests, method)
+        req_func = getattr(session or requests, method)
         kwargs = {}
         if data:
-            kwargs["data"] = json.dumps({"data": data})
+            kwargs["data"] = dumps({"data": data})
         if files:
             kwargs["files"] = files
         raw_response = req_func(full_url, headers=headers, **kwargs)
 
         if raw_response.status_code == 500:
             self._handle_500_error(raw_response)
-        response = raw_response.json()
+        response = parse_json_response(raw_response)
         if response["status"] == "error":
             logger.debug("There was an error, full error text is: %s",
                          raw_response.content)
@@ -99,8 +139,9 @@ class KazooRequest(object):
 
     def _handle_500_error(self, raw_response):
         request_id = raw_response.headers["X-Request-Id"]
-        if raw_response.json():
-            message = raw_response.json()["data"]
+        response = parse_json_response(raw_response)
+        if response:
+            message = response["data"]
         else:
             message = "There was no error message"
         raise KazooApiError(
@@ -109,6 +150,8 @@ class KazooRequest(object):
 
 
 class UsernamePasswordAuthRequest(KazooRequest):
+    __slots__ = ("username", "password", "account_name")
+
     def __init__(self, username, password, account_name):
         super(UsernamePasswordAuthRequest, self).__init__(
             "/user_auth", auth_required=False)
@@ -116,13 +159,13 @@ class UsernamePasswordAuthRequest(KazooRequest):
         self.password = password
         self.account_name = account_name
 
-    def execute(self, base_url):
+    def execute(self, base_url, session=None):
         data = {
             "credentials": self._get_hashed_credentials(),
             "account_name": self.account_name,
         }
         return super(UsernamePasswordAuthRequest, self).execute(
-            base_url, method="put", data=data)
+            base_url, method="put", data=data, session=session)
 
     def _get_hashed_credentials(self):
         m = hashlib.md5()
@@ -131,14 +174,16 @@ class UsernamePasswordAuthRequest(KazooRequest):
 
 
 class ApiKeyAuthRequest(KazooRequest):
+    __slots__ = ("api_key",)
+
     def __init__(self, api_key):
         super(ApiKeyAuthRequest, self).__init__(
             "/api_auth", auth_required=False)
         self.api_key = api_key
 
-    def execute(self, base_url):
+    def execute(self, base_url, session=None):
         data = {
             "api_key": self.api_key
         }
         return super(ApiKeyAuthRequest, self).execute(
-            base_url, data=data, method="put")
+            base_url, data=data, method="put", session=session)
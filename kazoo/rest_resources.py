@@ -1,12 +1,17 @@
-import re
+import string
 
-from .request_objects import KazooRequest
+from .request_objects import KazooRequest, PARAM_RE
 
 
 METHOD_TYPES = ("detail", "list", "update", "create", "delete")
 
 
 class RestResource(object):
+    __slots__ = ("name", "_plural_name", "_params", "required_args",
+                 "object_arg", "path", "_path_literals", "_path_tail",
+                 "extra_views", "_extra_views_by_path",
+                 "_extra_view_templates", "methods", "method_names")
+
     def __init__(self, name, path, plural_name=None, extra_views=None,
                  methods=METHOD_TYPES, exclude_methods=None,
                  method_names=None):
@@ -14,13 +19,16 @@ class RestResource(object):
         exclude_methods = exclude_methods or []
         method_names = method_names or {}
 
-        self._param_regex = re.compile("{([a-zA-Z0-9_]+)}")
         self.name = name
         self._plural_name = plural_name
-        self._check_at_least_one_argument(path)
-        self.required_args = self._get_required_arguments(path)
-        self.object_arg = self._get_object_argument(path)
-        self.path = self._get_resource_path(path)
+        param_matches = self._get_params(path)
+        self._params = [match.group(1) for match in param_matches]
+        self._check_at_least_one_argument()
+        self.required_args = self._get_required_arguments()
+        self.object_arg = self._get_object_argument()
+        self.path = self._get_resource_path(path, param_matches[-1])
+        self._path_literals, self._path_tail = self._split_path_template(
+            self.path)
         self._initialize_extra_view_descriptions(extra_views)
         self._initialize_methods(methods, exclude_methods)
         self._initialize_method_names(method_names)
@@ -39,29 +47,61 @@ class RestResource(object):
         self.methods = list(set(methods) - set(exclude_methods))
 
     @staticmethod
-    def _get_resource_path(path):
-        return path[:path.rfind("{") - 1]
+    def _get_resource_path(path, object_arg_match):
+        # Strip the object argument and the slash preceding it
+        return path[:object_arg_match.start() - 1]
 
-    def _check_at_least_one_argument(self, path):
-        if not self._get_params(path):
+    def _check_at_least_one_argument(self):
+        if not self._params:
             raise ValueError("Rest resources need at least one argument")
 
-    def _get_required_arguments(self, path):
-        params = self._get_params(path)
-        if len(params) > 1:
-            return params[:-1]
+    def _get_required_arguments(self):
+        if len(self._params) > 1:
+            return self._params[:-1]
         return []
 
-    def _get_object_argument(self, path):
-        return self._get_params(path)[-1]
+    def _get_object_argument(self):
+        return self._params[-1]
+
+    @staticmethod
+    def _get_params(path):
+        return list(PARAM_RE.finditer(path))
 
-    def _get_params(self, path):
-        param_names = self._param_regex.findall(path)
-        return param_names
+    def _format_path(self, params):
+        # Equivalent to self.path.format(**params) without re-parsing the
+        # template on every request, the fields of the path are the
+        # required arguments in order.
+        return self._format_path_args(
+            [params[argname] for argname in self.required_args])
 
     def _get_full_url(self, params):
         object_id = params[self.object_arg]
-        return self.path.format(**params) + "/{0}".format(object_id)
+        return self._format_path(params) + "/" + str(object_id)
+
+    @staticmethod
+    def _split_path_template(template):
+        # Split a path template into the literal preceding each field and
+        # the literal text following the last field.
+        parts = list(string.Formatter().parse(template))
+        literals = [literal for literal, field_name, _, _ in parts
+                    if field_name]
+        tail = "".join(literal for literal, field_name, _, _ in parts
+                       if not field_name)
+        return literals, tail
+
+    @staticmethod
+    def _format_template_args(literals, tail, args):
+        return "".join([literal + str(arg) for literal, arg
+                        in zip(literals, args)]) + tail
+
+    def _format_path_args(self, args):
+        # Positional variant of _format_path, args are the values of
+        # required_args in order, optionally followed by the object argument.
+        return self._format_template_args(self._path_literals,
+                                          self._path_tail, args)
+
+    def _get_full_url_args(self, args):
+        return self._format_path_args(args) + "/" + str(args[-1])
 
     def _initialize_extra_view_descriptions(self, view_descs):
         self.extra_views = []
@@ -74,11 +114,25 @@ class RestResource(object):
                 result["scope"] = "aggregate"
             if "method" not in result:
                 result["method"] = "get"
+            result["_suffix"] = "/" + result["path"]
             self.extra_views.append(result)
+        self._extra_views_by_path = dict(
+            (view_desc["path"], view_desc) for view_desc in self.extra_views)
+        self._extra_view_templates = [
+            self._get_extra_view_template(view_desc)
+            for view_desc in self.extra_views]
+
+    def _get_extra_view_template(self, view_desc):
+        if view_desc["scope"] == "aggregate":
+            template = self.path + view_desc["_suffix"]
+        else:
+            template = "{0}/{{{1}}}{2}".format(self.path, self.object_arg,
+                                               view_desc["_suffix"])
+        literals, tail = self._split_path_template(template)
+        return literals, tail, view_desc["method"]
 
     def get_list_request(self, **kwargs):
-        relative_path = self.path.format(**kwargs)
-        return KazooRequest(relative_path)
+        return KazooRequest(self._format_path(kwargs))
 
     def get_object_request(self, **kwargs):
         return KazooRequest(self._get_full_url(kwargs))
@@ -90,21 +144,48 @@ class RestResource(object):
         return KazooRequest(self._get_full_url(kwargs), method='delete')
 
     def get_create_object_request(self, **kwargs):
-        return KazooRequest(self.path.format(**kwargs), method='put')
+        return KazooRequest(self._format_path(kwargs), method='put')
 
     def get_extra_view_request(self, viewname, **kwargs):
-        view_desc = None
-        for desc in self.extra_views:
-            if desc["path"] == viewname:
-                view_desc = desc
+        view_desc = self._extra_views_by_path.get(viewname)
         if view_desc is None:
             raise ValueError("Unknown extra view name {0}".format(viewname))
         if view_desc["scope"] == "aggregate":
-            return KazooRequest(self.path.format(**kwargs) + "/" + viewname,
-                                method=view_desc["method"])
-        return KazooRequest(self._get_full_url(kwargs) + "/" + viewname,
+            base_path = self._format_path(kwargs)
+        else:
+            base_path = self._get_full_url(kwargs)
+        return KazooRequest(base_path + view_desc["_suffix"],
                             method=view_desc["method"])
 
+    # The *_pos variants below take the path arguments positionally, in the
+    # order of required_args followed by object_arg where the request is for
+    # a single object. They are used by the generated client methods, which
+    # know the order of their arguments, to avoid building a kwargs dict.
+
+    def get_list_request_pos(self, *args):
+        return KazooRequest(self._format_path_args(args))
+
+    def get_object_request_pos(self, *args):
+        return KazooRequest(self._get_full_url_args(args))
+
+    def get_update_object_request_pos(self, *args):
+        return KazooRequest(self._get_full_url_args(args), method='post')
+
+    def get_delete_object_request_pos(self, *args):
+        return KazooRequest(self._get_full_url_args(args), method='delete')
+
+    def get_create_object_request_pos(self, *args):
+        return KazooRequest(self._format_path_args(args), method='put')
+
+    def get_extra_view_request_fast(self, view_index, *args):
+        """Build the request for the extra view at view_index in
+        extra_views from positional path arguments, using the view's
+        pre-parsed path template.
+        """
+        literals, tail, method = self._extra_view_templates[view_index]
+        return KazooRequest(self._format_template_args(literals, tail, args),
+                            method=method)
+
     @property
     def plural_name(self):
         if self._plural_name:
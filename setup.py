@@ -20,7 +20,16 @@ setup(
     download_url=(
         'https://github.com/telephoneorg/kazoo-sdk/tarball/v%s' % version),
     packages=find_packages(),
-    install_requires=["requests>=2.2.1", "six"],
+    install_requires=["requests>=2.10.0", "six",
+                      "futures; python_version < '3'",
+                      "funcsigs; python_version < '3'"],
+    extras_require={
+        "orjson": ["orjson"],
+        "http2": ["httpx[http2]>=0.24"],
+        # The zstd extra only exists from urllib3 2.0, on urllib3 1.x only
+        # the brotli decoder is installed and zstd isn't supported.
+        "compression": ["urllib3[brotli,zstd]"],
+    },
     test_requires=["mock", "tox"],
     license="MIT License",
     readme='README.rst',
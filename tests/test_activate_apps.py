@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+import unittest
+
+import mock
+
+from kazoo import Client
+
+
+class ActivateAppsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(api_key="sometoken")
+        self.apps = [{"id": "app{0}".format(i)} for i in range(6)]
+        self.client.list_apps = mock.Mock(return_value=(True, self.apps))
+
+    def test_results_returned_in_app_order(self):
+        def activate_app(acct_id, app_id):
+            # Make the earlier apps finish last
+            time.sleep(0.01 * (6 - int(app_id[3:])))
+            return True, app_id
+
+        self.client.activate_app = mock.Mock(side_effect=activate_app)
+        results = self.client.activate_apps("acct")
+        self.assertEqual(results,
+                         [(True, app["id"]) for app in self.apps])
+        self.client.activate_app.assert_has_calls(
+            [mock.call("acct", app["id"]) for app in self.apps],
+            any_order=True)
+
+    def test_max_workers_passed_to_executor(self):
+        self.client.activate_app = mock.Mock(return_value=(True, {}))
+        with mock.patch("kazoo.client.ThreadPoolExecutor",
+                        wraps=ThreadPoolExecutor) as mock_executor:
+            self.client.activate_apps("acct", max_workers=3)
+        mock_executor.assert_called_once_with(max_workers=3)
+
+    def test_activation_error_raised(self):
+        def activate_app(acct_id, app_id):
+            if app_id == "app3":
+                raise RuntimeError("activation failed")
+            return True, app_id
+
+        self.client.activate_app = mock.Mock(side_effect=activate_app)
+        with self.assertRaises(RuntimeError):
+            self.client.activate_apps("acct")
@@ -13,5 +13,40 @@ class AuthenticationTestCase(unittest.TestCase):
             mock_req_class.return_value = mock_req
             client = Client(api_key="dsfjasbfkasdf")
             client.authenticate()
-            mock_req.execute.assert_called_with(client.base_url)
+            mock_req.execute.assert_called_with(client.base_url,
+                                                session=client.session)
             self.assertEqual(client.auth_token, "authorizethis")
+
+    def test_authentication_updates_manual_request_headers(self):
+        with mock.patch('kazoo.client.ApiKeyAuthRequest') as mock_req_class:
+            mock_req_class.return_value.execute.return_value = {
+                "auth_token": "authorizethis"}
+            client = Client(api_key="dsfjasbfkasdf")
+            client.authenticate()
+            with mock.patch.dict(client._method_dispatch,
+                                 {'get': mock.Mock()}):
+                mock_get = client._method_dispatch['get']
+                mock_get.return_value.status_code = 200
+                mock_get.return_value.content = b'{"data": {}}'
+                client.manual_request('/somepath',
+                                      headers={'Content-Type': 'text/csv'})
+                mock_get.assert_called_with(
+                    client.base_url + '/somepath',
+                    headers={'Content-Type': 'text/csv',
+                             'X-Auth-Token': 'authorizethis'},
+                    data=None, files=None)
+            self.assertEqual(client._base_headers['Content-Type'],
+                             'application/json')
+
+    def test_assigned_auth_token_used_by_manual_request(self):
+        client = Client(api_key="dsfjasbfkasdf")
+        client.auth_token = "assignedtoken"
+        with mock.patch.dict(client._method_dispatch,
+                             {'get': mock.Mock()}):
+            mock_get = client._method_dispatch['get']
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.content = b'{"data": {}}'
+            client.manual_request('/somepath')
+            self.assertEqual(
+                mock_get.call_args[1]['headers']['X-Auth-Token'],
+                'assignedtoken')
@@ -1,9 +1,14 @@
 import unittest
-import inspect
 
+import mock
 import six
 
-from kazoo.client import RestClientMetaClass
+try:
+    from inspect import signature
+except ImportError:
+    from funcsigs import signature
+
+from kazoo.client import RestClientMetaClass, LazyResourceMethod
 from kazoo.rest_resources import RestResource
 
 
@@ -38,13 +43,16 @@ class TestClass(six.with_metaclass(RestClientMetaClass)):
         })
 
 
+def get_arg_names(method):
+    return list(signature(method.__func__).parameters)
+
+
 class MetaclassMethodCreationTestCase(unittest.TestCase):
     def setUp(self):
         self.test_resource = TestClass()
 
     def test_get_list_resource_has_no_args(self):
-        args, _, _, _ = inspect.getargspec(
-            self.test_resource.get_some_resources)
+        args = get_arg_names(self.test_resource.get_some_resources)
         self.assertEqual(args, ["self", "resource_one_id"])
 
     def test_get_single_resource_has_object_id_as_argument(self):
@@ -58,8 +66,7 @@ class MetaclassMethodCreationTestCase(unittest.TestCase):
         self._assert_resource_id_arguments("delete_some_resource")
 
     def test_create_resource_has_no_object_id(self):
-        args, _, _, _ = inspect.getargspec(
-            self.test_resource.create_some_resource)
+        args = get_arg_names(self.test_resource.create_some_resource)
         self.assertEqual(args, ["self", "resource_one_id", "data"])
 
     def test_extra_views_created(self):
@@ -67,7 +74,7 @@ class MetaclassMethodCreationTestCase(unittest.TestCase):
         self.assertTrue(hasattr(self.test_resource, "get_unavailable"))
 
     def test_extra_view_with_object_scope_has_extra_argument(self):
-        args, _, _, _ = inspect.getargspec(self.test_resource.get_tool_users)
+        args = get_arg_names(self.test_resource.get_tool_users)
         self.assertEqual(args, ["self", "shed_id", "tool_id"])
 
     def test_only_specified_methods_created(self):
@@ -81,9 +88,41 @@ class MetaclassMethodCreationTestCase(unittest.TestCase):
         for name in invalid_names:
             self.assertFalse(hasattr(self.test_resource, name))
 
+    def test_generated_method_names(self):
+        method = TestClass.get_some_resource
+        self.assertEqual(method.__name__, "get_some_resource")
+        self.assertEqual(method.__qualname__, "TestClass.get_some_resource")
+
+    def test_methods_generated_on_first_access(self):
+        class LazyClass(six.with_metaclass(RestClientMetaClass)):
+            some_resource = RestResource("widget", "/widgets/{widget_id}")
+
+        self.assertTrue(isinstance(LazyClass.__dict__["get_widget"],
+                                   LazyResourceMethod))
+        method = LazyClass().get_widget
+        self.assertEqual(method.__name__, "get_widget")
+        self.assertFalse(isinstance(LazyClass.__dict__["get_widget"],
+                                    LazyResourceMethod))
+        self.assertTrue(isinstance(LazyClass.__dict__["get_widgets"],
+                                   LazyResourceMethod))
+
+    def test_generated_method_builds_request(self):
+        with mock.patch.object(TestClass, "_execute_request",
+                               create=True) as mock_execute:
+            self.test_resource.update_some_resource(1, resource_two_id=2,
+                                                    data={"a": "b"})
+            request = mock_execute.call_args[0][0]
+            self.assertEqual(request.path, "/1/subresources/2")
+            self.assertEqual(request.method, "post")
+            self.assertEqual(mock_execute.call_args[1], {"data": {"a": "b"}})
+
+    def test_generated_method_checks_arguments(self):
+        with self.assertRaises(TypeError):
+            self.test_resource.get_some_resource(1)
+
     def _assert_resource_id_arguments(self, method_name, includes_data=False):
         func = getattr(self.test_resource, method_name)
-        args, _, _, _ = inspect.getargspec(func)
+        args = get_arg_names(func)
         if includes_data:
             self.assertEqual(args,
                              ["self",
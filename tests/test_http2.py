@@ -0,0 +1,63 @@
+import json
+import sys
+import unittest
+
+import mock
+
+from kazoo import Client, exceptions, http2
+from kazoo.request_objects import KazooRequest
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class Http2SessionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+        self.client = Client(api_key="sometoken", use_http2=True)
+        self.client.session.client.close()
+        self.client.session.client = httpx.Client(
+            transport=httpx.MockTransport(self.handle_request))
+
+    def handle_request(self, request):
+        self.requests.append(request)
+        return httpx.Response(200, json={"status": "success",
+                                         "data": {"id": "someid"}})
+
+    def test_client_uses_http2_session(self):
+        self.assertTrue(isinstance(self.client.session, http2.Http2Session))
+
+    def test_resource_method_sends_json(self):
+        self.client.update_account("acct", {"name": "somename"})
+        request = self.requests[-1]
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(str(request.url),
+                         self.client.base_url + "/accounts/acct")
+        self.assertEqual(json.loads(request.content.decode("utf-8")),
+                         {"data": {"name": "somename"}})
+
+    def test_manual_request_returns_data(self):
+        self.assertEqual(self.client.manual_request("/somepath"),
+                         (True, {"id": "someid"}))
+        self.assertEqual(self.requests[-1].method, "GET")
+
+    def test_execute_without_body(self):
+        request = KazooRequest("/somepath", auth_required=False)
+        request.execute(self.client.base_url, session=self.client.session)
+        self.assertEqual(self.requests[-1].content, b"")
+
+
+class Http2UnavailableTestCase(unittest.TestCase):
+    def test_missing_httpx_raises(self):
+        with mock.patch.dict(sys.modules, {"httpx": None}):
+            with self.assertRaises(exceptions.InvalidConfigurationError):
+                Client(api_key="sometoken", use_http2=True)
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    def test_missing_h2_raises(self):
+        with mock.patch.dict(sys.modules, {"h2": None}):
+            with self.assertRaises(exceptions.InvalidConfigurationError):
+                Client(api_key="sometoken", use_http2=True)
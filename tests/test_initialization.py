@@ -1,6 +1,11 @@
+import threading
 import unittest
 
-from kazoo import Client
+import mock
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+import requests
+
+from kazoo import Client, exceptions
 from kazoo.request_objects import (
     UsernamePasswordAuthRequest, ApiKeyAuthRequest)
 
@@ -51,3 +56,78 @@ class ConstructorRequiredArgumentsTestCase(unittest.TestCase):
     def test_with_token_creates_api_key_auth_request(self):
         client = Client(api_key="fhasdlkjfblkasd")
         self.assertEqual(type(client.auth_request), ApiKeyAuthRequest)
+
+
+class SessionTestCase(unittest.TestCase):
+    def test_client_creates_session(self):
+        client = Client(api_key="sometoken")
+        self.assertTrue(isinstance(client.session, requests.Session))
+
+    def test_session_adapters_mounted(self):
+        client = Client(api_key="sometoken")
+        for prefix in ("http://", "https://"):
+            adapter = client.session.get_adapter(prefix + "api.example.com")
+            self.assertEqual(adapter.max_retries.total, 3)
+
+    def test_put_is_not_retried(self):
+        client = Client(api_key="sometoken")
+        adapter = client.session.get_adapter("http://api.example.com")
+        retry = adapter.max_retries
+        self.assertFalse(retry.is_retry("PUT", 503))
+        self.assertFalse(retry.is_retry("POST", 503))
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertTrue(retry.is_retry("DELETE", 503))
+
+    def test_context_manager_closes_session(self):
+        with mock.patch.object(requests.Session, "close") as mock_close:
+            with Client(api_key="sometoken"):
+                pass
+            mock_close.assert_called_once_with()
+
+
+class UnavailableHandler(BaseHTTPRequestHandler):
+    def _respond(self):
+        self.server.methods.append(self.command)
+        body = b'{"status": "error", "error": "503", "message": "down", ' \
+               b'"request_id": "someid"}'
+        self.send_response(503)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_PUT = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class RetryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), UnavailableHandler)
+        self.server.methods = []
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.client = Client(
+            api_key="sometoken",
+            base_url="http://127.0.0.1:{0}".format(self.server.server_port))
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_exhausted_retries_return_last_response(self):
+        success, response = self.client.manual_request("/somepath")
+        self.assertFalse(success)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.methods, ["GET"] * 4)
+
+    def test_put_sent_once(self):
+        success, response = self.client.manual_request("/somepath", "put")
+        self.assertFalse(success)
+        self.assertEqual(self.server.methods, ["PUT"])
+
+    def test_kazoo_error_raised_after_retries(self):
+        with self.assertRaises(exceptions.KazooApiError):
+            self.client.get_callflows("someaccount")
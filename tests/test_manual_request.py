@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+import mock
+import requests
+
+from kazoo import Client, exceptions
+
+
+def make_response(status_code=200, content=b'{"data": {}}'):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+class ManualRequestStreamingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(api_key="dsfjasbfkasdf")
+        self.content = b"prefix,rate\n1,0.01\n" * 1000
+        fd, self.path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "wb") as ratedeck:
+            ratedeck.write(self.content)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def send(self, adapter, request, **kwargs):
+        # Record what reaches the transport before anything consumes it
+        self.sent_body = request.body
+        self.sent_position = request.body.tell()
+        self.sent_headers = request.headers
+        return make_response()
+
+    def test_file_data_sent_unread(self):
+        with mock.patch.object(requests.adapters.HTTPAdapter, "send",
+                               autospec=True) as mock_send:
+            mock_send.side_effect = self.send
+            with open(self.path, "rb") as fd:
+                self.client.manual_request("/rates", "post", data=fd)
+                self.assertTrue(self.sent_body is fd)
+        self.assertEqual(self.sent_position, 0)
+        self.assertEqual(self.sent_headers["Content-Length"],
+                         str(len(self.content)))
+        self.assertFalse("Transfer-Encoding" in self.sent_headers)
+
+    def test_upload_ratedeck_streams_file(self):
+        with mock.patch.object(requests.adapters.HTTPAdapter, "send",
+                               autospec=True) as mock_send:
+            mock_send.side_effect = self.send
+            self.client.upload_ratedeck(self.path)
+        self.assertFalse(isinstance(self.sent_body, bytes))
+        self.assertEqual(self.sent_body.name, self.path)
+        self.assertEqual(self.sent_position, 0)
+        self.assertEqual(self.sent_headers["Content-Type"], "text/csv")
+
+
+class ManualRequestMethodTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(api_key="dsfjasbfkasdf")
+
+    def test_accepts_upper_case_method(self):
+        with mock.patch.object(self.client.session,
+                               "request") as mock_request:
+            mock_request.return_value = make_response(404)
+            self.client.manual_request("/somepath", "PUT")
+            self.assertEqual(mock_request.call_args[0][0], "PUT")
+
+    def test_checks_method_allowed(self):
+        with self.assertRaises(exceptions.InvalidHttpMethodError):
+            self.client.manual_request("/somepath", "baha")
@@ -0,0 +1,20 @@
+import unittest
+
+from kazoo.client import parse_list
+
+
+class ParseListTestCase(unittest.TestCase):
+    def test_bracketed_list(self):
+        self.assertEqual(parse_list("[a,b,c]"), ["a", "b", "c"])
+
+    def test_unbracketed_list_keeps_all_characters(self):
+        self.assertEqual(parse_list("abc,def"), ["abc", "def"])
+
+    def test_single_value(self):
+        self.assertEqual(parse_list("[abc]"), ["abc"])
+
+    def test_empty_string(self):
+        self.assertEqual(parse_list(""), [""])
+
+    def test_empty_brackets(self):
+        self.assertEqual(parse_list("[]"), [""])
@@ -15,7 +15,15 @@ class RequestTestCase(unittest.TestCase):
     def assert_data(self, mock_request, expected_data):
         expected_wrapper = {"data": expected_data}
         mock_request.assert_called_with(mock.ANY, headers=mock.ANY,
-                                        data=json.dumps(expected_wrapper))
+                                        data=mock.ANY)
+        sent_data = mock_request.call_args[1]["data"]
+        self.assertEqual(json.loads(sent_data.decode("utf-8")),
+                         expected_wrapper)
+
+    def mock_success(self, mock_request):
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.content = utils.json_content(
+            {"status": "success"})
 
 
 class RequestObjectParameterTestCase(RequestTestCase):
@@ -34,9 +42,9 @@ class RequestObjectParameterTestCase(RequestTestCase):
     def test_url_contains_param(self):
         req_obj = self.create_req_obj(self.url)
         with mock.patch('requests.get') as mock_get:
-            mock_get.return_value.json.return_value = {
+            mock_get.return_value.content = utils.json_content({
                 "some_key": "some_val", "status": "success"
-            }
+            })
             req_obj.execute("http://testserver", param1="somevalue")
             mock_get.assert_called_with("http://testserver/testpath/somevalue",
                                         headers=mock.ANY)
@@ -45,6 +53,7 @@ class RequestObjectParameterTestCase(RequestTestCase):
         req_obj = self.create_req_obj(self.url)
         with mock.patch('requests.get') as mock_get, \
                 mock.patch('requests.post') as mock_post:
+            self.mock_success(mock_post)
             req_obj.execute("http://testserver", param1="value", method="post")
             mock_post.assert_called_with("http://testserver/testpath/value",
                                          headers=mock.ANY)
@@ -53,6 +62,7 @@ class RequestObjectParameterTestCase(RequestTestCase):
         req_obj = self.create_req_obj(self.url, method='post')
         with mock.patch('requests.get') as mock_get, \
                 mock.patch('requests.post') as mock_post:
+            self.mock_success(mock_post)
             req_obj.execute("http://testserver", param1="value")
             mock_post.assert_called_with("http://testserver/testpath/value",
                                          headers=mock.ANY)
@@ -66,6 +76,7 @@ class RequestObjectParameterTestCase(RequestTestCase):
     def test_auth_required_does_not_throw_if_token_present(self):
         req_obj = self.create_req_obj(self.url, auth_required=True)
         with mock.patch('requests.get') as mock_get:
+            self.mock_success(mock_get)
             req_obj.execute("https://testserver", token="jfhasdfasd",
                             param1="value3")
 
@@ -77,6 +88,7 @@ class RequestObjectDataParamsTestCase(RequestTestCase):
     def test_data_sent_to_server(self):
         req_obj = KazooRequest(self.path, auth_required=False)
         with mock.patch('requests.get') as mock_get:
+            self.mock_success(mock_get)
             data_dict = {
                 "data1": "dataval1"
             }
@@ -87,6 +99,7 @@ class RequestObjectDataParamsTestCase(RequestTestCase):
     def test_data_sent_to_server_with_auth_if_required(self):
         req_obj = KazooRequest(self.path, auth_required=True)
         with mock.patch('requests.post') as mock_post:
+            self.mock_success(mock_post)
             data_dict = {
                 "data1": "dataval1"
             }
@@ -109,7 +122,7 @@ class RequestObjectErrorHandling(RequestTestCase):
         req_obj = KazooRequest("/somepath", auth_required=False)
         with mock.patch('requests.get') as mock_get:
             mock_response = mock.Mock()
-            mock_response.json.return_value = self.error_response
+            mock_response.content = utils.json_content(self.error_response)
             mock_get.return_value = mock_response
             with self.assertRaises(
                 exceptions.KazooApiAuthenticationError) as cm:
@@ -124,7 +137,7 @@ class RequestObjectErrorHandling(RequestTestCase):
             mock_response = mock.Mock()
             mock_response.status_code = 500
             mock_response.headers = {"X-Request-Id": "sdfaskldfjaosdf"}
-            mock_response.json.return_value = None
+            mock_response.content = utils.json_content(None)
             mock_get.return_value = mock_response
             with self.assertRaises(exceptions.KazooApiError) as cm:
                 req_obj.execute("http://testserver")
@@ -136,7 +149,7 @@ class RequestObjectErrorHandling(RequestTestCase):
             mock_response = mock.Mock()
             mock_response.status_code = 500
             mock_response.headers = {"X-Request-Id": "sdfaskldfjaosdf"}
-            mock_response.json.return_value = utils.load_fixture_as_dict(
+            mock_response.content = utils.load_fixture_as_bytes(
                 "bad_billing_status_response.json")
             mock_get.return_value = mock_response
             with self.assertRaises(exceptions.KazooApiError) as cm:
@@ -150,7 +163,7 @@ class RequestObjectErrorHandling(RequestTestCase):
         with mock.patch('requests.get') as mock_get:
             mock_response = mock.Mock()
             mock_response.status_code = 400
-            mock_response.json.return_value = utils.load_fixture_as_dict(
+            mock_response.content = utils.load_fixture_as_bytes(
                 "invalid_data_response.json")
             mock_get.return_value = mock_response
             with self.assertRaises(exceptions.KazooApiBadDataError) as cm:
@@ -166,9 +179,9 @@ class GetParametersTestCase(RequestTestCase):
         with mock.patch('requests.get') as mock_get:
             mock_response = mock.Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {
+            mock_response.content = utils.json_content({
                 "result": "fake", "status": "success"
-            }
+            })
             mock_get.return_value = mock_response
             request.execute("http://testserver.com")
             mock_get.assert_called_with(
@@ -188,6 +201,7 @@ class UsernamePasswordAuthRequestTestCase(RequestTestCase):
 
     def test_request_hits_correct_url(self):
         with mock.patch("requests.put") as mock_put:
+            self.mock_success(mock_put)
             self.req_obj.execute("http://testserver")
             mock_put.assert_called_with("http://testserver/user_auth",
                                         headers=mock.ANY,
@@ -195,6 +209,7 @@ class UsernamePasswordAuthRequestTestCase(RequestTestCase):
 
     def test_request_sends_correct_data(self):
         with mock.patch('requests.put') as mock_put:
+            self.mock_success(mock_put)
             expected_data = {
                 "credentials": self.hashed_credentials,
                 "account_name": self.account_name,
@@ -210,6 +225,7 @@ class ApiKeyAuthRequestTestCase(RequestTestCase):
 
     def test_correct_url_hit(self):
         with mock.patch('requests.put') as mock_put:
+            self.mock_success(mock_put)
             self.req_obj.execute("http://testserver")
             mock_put.assert_called_with("http://testserver/api_auth",
                                         headers=mock.ANY,
@@ -217,8 +233,24 @@ class ApiKeyAuthRequestTestCase(RequestTestCase):
 
     def test_correct_data_sent(self):
         with mock.patch('requests.put') as mock_put:
+            self.mock_success(mock_put)
             self.req_obj.execute("http://testserver")
             expected_data = {
                 "api_key": self.api_key
             }
             self.assert_data(mock_put, expected_data)
+
+
+class SessionRequestTestCase(RequestTestCase):
+    def test_session_used_when_given(self):
+        req_obj = KazooRequest("/somepath", auth_required=False)
+        mock_session = mock.Mock()
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = utils.json_content({
+            "status": "success"
+        })
+        with mock.patch('requests.get') as mock_get:
+            req_obj.execute("http://testserver", session=mock_session)
+            self.assertFalse(mock_get.called)
+        mock_session.get.assert_called_with("http://testserver/somepath",
+                                            headers=mock.ANY)
@@ -108,6 +108,59 @@ class ExtraViewsResourceTestCase(unittest.TestCase):
         self.assertEqual(request.method, "put")
 
 
+class PositionalRequestTestCase(unittest.TestCase):
+    def setUp(self):
+        self.resource = RestResource(
+            "doc", "/accounts/{account_id}/numbers/{number}/docs/{filename}")
+
+    def test_list_request_matches_keyword_request(self):
+        self.assertEqual(
+            self.resource.get_list_request_pos("abc", 5).path,
+            self.resource.get_list_request(account_id="abc", number=5).path)
+
+    def test_object_request_matches_keyword_request(self):
+        request = self.resource.get_object_request_pos("abc", 5, "x.pdf")
+        self.assertEqual(request.path, "/accounts/abc/numbers/5/docs/x.pdf")
+        self.assertEqual(request.method, "get")
+
+    def test_update_delete_and_create_methods(self):
+        self.assertEqual(
+            self.resource.get_update_object_request_pos(1, 2, 3).method,
+            "post")
+        self.assertEqual(
+            self.resource.get_delete_object_request_pos(1, 2, 3).method,
+            "delete")
+        request = self.resource.get_create_object_request_pos(1, 2)
+        self.assertEqual(request.path, "/accounts/1/numbers/2/docs")
+        self.assertEqual(request.method, "put")
+
+
+class IndexedExtraViewRequestTestCase(unittest.TestCase):
+    def setUp(self):
+        self.resource = RestResource(
+            "server", "/accounts/{account_id}/servers/{server_id}",
+            extra_views=[
+                {"name": "get_deployment", "path": "deployment",
+                 "scope": "object"},
+                {"name": "create_deployment", "path": "deployment",
+                 "scope": "object", "method": "put"},
+                {"name": "get_server_log", "path": "log"}])
+
+    def test_object_scope_view(self):
+        request = self.resource.get_extra_view_request_fast(0, "a", "s")
+        self.assertEqual(request.path, "/accounts/a/servers/s/deployment")
+        self.assertEqual(request.method, "get")
+
+    def test_views_sharing_a_path_keep_their_own_method(self):
+        request = self.resource.get_extra_view_request_fast(1, "a", "s")
+        self.assertEqual(request.path, "/accounts/a/servers/s/deployment")
+        self.assertEqual(request.method, "put")
+
+    def test_aggregate_scope_view(self):
+        request = self.resource.get_extra_view_request_fast(2, "a")
+        self.assertEqual(request.path, "/accounts/a/servers/log")
+
+
 class PluralNameResourceTestCase(unittest.TestCase):
     def test_resource_plural_name(self):
         resource = RestResource("subresource", "/{oneid}/someotherplace")
@@ -169,3 +222,17 @@ class ResourcePathTestCase(unittest.TestCase):
             "/accounts/{account_id}/phone_numbers/{phone_number}")
         self.assertEqual(resource.path,
                          "/accounts/{account_id}/phone_numbers")
+
+
+class PathFormattingTestCase(unittest.TestCase):
+    def test_format_path_matches_str_format(self):
+        resource = RestResource(
+            "doc", "/accounts/{account_id}/numbers/{number}/docs/{filename}")
+        params = {"account_id": "abc", "number": 5, "filename": "x.pdf"}
+        self.assertEqual(resource._format_path(params),
+                         resource.path.format(**params))
+
+    def test_format_path_requires_params(self):
+        resource = RestResource("doc", "/accounts/{account_id}/docs/{doc_id}")
+        with self.assertRaises(KeyError):
+            resource.get_list_request()
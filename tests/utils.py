@@ -13,3 +13,11 @@ def load_fixture(filename):
 
 def load_fixture_as_dict(filename):
     return json.loads(load_fixture(filename))
+
+
+def load_fixture_as_bytes(filename):
+    return load_fixture(filename).encode("utf-8")
+
+
+def json_content(data):
+    return json.dumps(data).encode("utf-8")